@@ -170,6 +170,10 @@ class Frame(Group):
 
             self.writeoutput(i)
 
+        # Wait for a pending background write of a threaded writer
+        if self.writer is not None:
+            self.writer.wait()
+
         # Timekeeping
         tfin = monotonic()
         t_exec = timedelta(seconds=int(tfin-tini))
@@ -33,6 +33,7 @@ class Group(AbstractGroup):
         -----
         The updater of groups can take a list of string with the attribute names that should be updated
         in the order in which they should be updated. It will create a callable function from that list."""
+        self._repr_cache = None
         self._description = description
         self._owner = owner
         self._updateorder = None
@@ -45,63 +46,82 @@ class Group(AbstractGroup):
             self.__dict__[name]._setvalue(value)
         else:
             super().__setattr__(name, value)
+            # The attribute structure changed: invalidate the cached key lists
+            self.__dict__["_repr_cache"] = None
+
+    def __delattr__(self, name):
+        """Function to delete an attribute."""
+        super().__delattr__(name)
+        # The attribute structure changed: invalidate the cached key lists
+        self.__dict__["_repr_cache"] = None
 
     def __repr__(self):
         """Function to have good looking overview of the members of the group."""
 
-        fields = {}
-        groups = {}
-        misc = {}
+        # The sorted key lists are cached and only rebuilt if the attribute
+        # structure changed since the last call.
+        cache = self.__dict__.get("_repr_cache", None)
+        if cache is None:
+            fields = []
+            groups = []
+            misc = []
+
+            for key, val in self.__dict__.items():
+                # Don't show private attributes
+                if key.startswith("_"):
+                    continue
+
+                # Sort attributes by group, field and else
+                if isinstance(val, Field):
+                    fields.append(key)
+                elif isinstance(val, Group):
+                    groups.append(key)
+                else:
+                    misc.append(key)
+
+            cache = (tuple(sorted(groups, key=str.casefold)),
+                     tuple(sorted(fields, key=str.casefold)),
+                     tuple(sorted(misc, key=str.casefold)))
+            self.__dict__["_repr_cache"] = cache
+        groups, fields, misc = cache
 
         # return value
         ret = ""
 
-        for key, val in self.__dict__.items():
-            # Don't show private attributes
-            if key.startswith("_"):
-                continue
-
-            # Sort attributes by group, field and else
-            if isinstance(val, Field):
-                fields[key] = val
-            elif isinstance(val, Group):
-                groups[key] = val
-            else:
-                misc[key] = val
-
         # Underlined headline. The length of the underline is off if there are hidden characters, like color.
         ret += self.__str__() + "\n"
         ret += "-" * (len(ret) - 1) + "\n"
 
         # Printing all groups alphanumerically sorted by name
         if len(groups) > 0:
-            for key in sorted(groups.keys(), key=str.casefold):
+            for key in groups:
                 if len(key) > 12:
                     name = key[:9] + "..."
                 else:
                     name = key
-                ret += "    {:12s} : {}\n".format(name, groups[key])
+                ret += "    {:12s} : {}\n".format(name, self.__dict__[key])
             ret += "  -----\n"
 
         # Printing all fields alphanumerically sorted by name
         if len(fields) > 0:
-            for key in sorted(fields.keys(), key=str.casefold):
+            for key in fields:
                 if len(key) > 12:
                     name = key[:9] + "..."
                 else:
                     name = key
-                ret += "    {:12s} : {}\n".format(name, fields[key].__str__())
+                ret += "    {:12s} : {}\n".format(name,
+                                                  self.__dict__[key].__str__())
             ret += "  -----\n"
 
         # Printing everything else alphanumerically sorted
         if len(misc) > 0:
-            for key in sorted(misc.keys(), key=str.casefold):
+            for key in misc:
                 if len(key) > 12:
                     name = key[:9] + "..."
                 else:
                     name = key
                 ret += "    {:12s} : {}\n".format(name,
-                                                  type(misc[key]).__name__)
+                                                  type(self.__dict__[key]).__name__)
             ret += "  -----\n"
 
         # The Frame object should have an integrator and writer which are displayed separately.
@@ -192,6 +212,7 @@ class Group(AbstractGroup):
         """
         self.__dict__[name] = Field(self._owner, value, updater=updater,
                                     differentiator=differentiator, description=description, constant=constant, save=save, copy=copy)
+        self.__dict__["_repr_cache"] = None
 
     def addgroup(self, name, updater=None, description=""):
         """Function to add a new ``Group`` to the object.
@@ -207,6 +228,7 @@ class Group(AbstractGroup):
         """
         self.__dict__[name] = Group(
             self._owner, updater=updater, description=description)
+        self.__dict__["_repr_cache"] = None
 
     def addintegrationvariable(self, name, value, snapshots=[], updater=None, description="", copy=True):
         """Function to add a new integration variable ``IntVar`` to the object.
@@ -228,6 +250,7 @@ class Group(AbstractGroup):
         """
         self.__dict__[name] = IntVar(
             self._owner, value, updater=updater, snapshots=snapshots, description=description, copy=copy)
+        self.__dict__["_repr_cache"] = None
 
     def _checkupdatelist(self, ls):
         """This function checks if a list is suitable to be used as update.
@@ -239,10 +262,13 @@ class Group(AbstractGroup):
         for val in ls:
             if not isinstance(val, str):
                 raise ValueError("List has to be list of strings.")
-        for val in ls:
-            if val not in self.__dict__:
-                raise RuntimeError(
-                    "{} is not an attribute of the group".format(val))
+        # Dictionary-view subtraction checks all names at once
+        missing = set(ls) - self.__dict__.keys()
+        if missing:
+            # Report the first offender in list order
+            val = next(val for val in ls if val in missing)
+            raise RuntimeError(
+                "{} is not an attribute of the group".format(val))
 
     def _createupdatefromlist(self, ls):
         """This method creates an update method from a list.
@@ -255,7 +281,13 @@ class Group(AbstractGroup):
         Returns
         -------
         func : callable
-            Function that is reduced by <self> and <ls>."""
+            Function that is reduced by the resolved attributes.
+
+        Notes
+        -----
+        The attributes are resolved once when the updater is assigned. If an attribute
+        is replaced by a new object afterwards, e.g. with ``addfield``, the updater has
+        to be assigned again."""
 
         # To give meaningful information a new class of partial is created
         # with a new __repr__ method
@@ -264,7 +296,10 @@ class Group(AbstractGroup):
             def __repr__(self):
                 return type(self).__name__
 
-        f = list_updater(_dummyupdatewithlist, self, ls)
+        # Resolving the attributes once here avoids a dictionary lookup
+        # per attribute on every single update.
+        attrs = tuple(self.__dict__[val] for val in ls)
+        f = list_updater(_dummyupdatewithresolved, attrs)
         f.__doc__ = f"The attributes in this group are updated in the order: \n{ls}."
         return f
 
@@ -302,7 +337,8 @@ def _mem_tree(obj, prefix="", skip_hidden=True):
     total = 0.0
     prefix = prefix + 4 * " "
     for key in sorted(obj.__dict__.keys(), key=str.casefold):
-        if key == "_owner":
+        # Skip references and internal bookkeeping
+        if key in ("_owner", "_repr_cache"):
             continue
         if skip_hidden & key.startswith("_"):
             continue
@@ -344,15 +380,13 @@ def _toc_tree(obj, prefix=""):
     return ret
 
 
-def _dummyupdatewithlist(grp, ls, owner, *args, **kwargs):
-    """This method is a dummy method that updates all attributes given in ls.
+def _dummyupdatewithresolved(attrs, owner, *args, **kwargs):
+    """This method is a dummy method that updates all given attributes.
 
     Parameters
     ----------
-    grp : Group
-        group to which the attributes belong
-    ls : list
-        List of string with attributes of group that should be updated in that order
+    attrs : tuple
+        Tuple with the resolved attributes of the group that should be updated in that order
     owner : Frame
         Parent frame object
     args : additional positional arguments
@@ -361,5 +395,5 @@ def _dummyupdatewithlist(grp, ls, owner, *args, **kwargs):
     Notes
     -----
     args and kwargs are only passed to the updater of the Heartbeat, NOT systole or diastole."""
-    for val in ls:
-        grp.__dict__[val].update(*args, **kwargs)
+    for val in attrs:
+        val.update(*args, **kwargs)
@@ -1,4 +1,5 @@
 import numpy as np
+import warnings
 
 from simframe.frame.field import Field
 from simframe.frame.heartbeat import Heartbeat
@@ -59,9 +60,10 @@ class IntVar(Field):
 
     def update(self):
         """Not used for ``IntVar``."""
-        msg = "{}: {}".format(colorize("Warning", "yellow"),
-                              "Do not update the integration variable by hand.")
-        print(msg)
+        # warnings.warn is skipped cheaply if the user filtered it, unlike an
+        # unconditional print.
+        warnings.warn(
+            "Do not update the integration variable by hand.", UserWarning)
 
     def suggest(self, value, reset=False):
         """Suggest a step size
@@ -7,6 +7,10 @@ class Updater():
 
     __name__ = "Updater"
 
+    # Updater objects sit in the innermost dispatch loop. Slots avoid the
+    # per-instance dict and make the attribute access a fixed-offset load.
+    __slots__ = ("_func",)
+
     def __init__(self, func=None):
         """Contains update instructions.
 
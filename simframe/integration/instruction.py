@@ -10,6 +10,8 @@ class Instruction(Scheme):
 
     __name__ = "Instruction"
 
+    __slots__ = ("_Y", "_fstep", "_scratch")
+
     def __init__(self, scheme, Y, fstep=1., controller={}, description=""):
         """Integration instruction
 
@@ -28,6 +30,7 @@ class Instruction(Scheme):
         super().__init__(scheme, controller, description)
         self.Y = Y
         self.fstep = fstep
+        self._scratch = None
 
     @property
     def Y(self):
@@ -47,6 +50,8 @@ class Instruction(Scheme):
 
     @fstep.setter
     def fstep(self, value):
+        if isinstance(value, int) and not isinstance(value, bool):
+            value = float(value)
         if not isinstance(value, float):
             raise TypeError("<fstep> has to be of type float.")
         if value <= 0. or value > 1.:
@@ -67,11 +72,20 @@ class Instruction(Scheme):
             New value of the variable to be integrated"""
         x0 = self.Y._owner.integrator.var
         Y0 = self.Y
-        ret = self.scheme(x0, Y0, self.fstep*dx, **self.controller)
-        if ret is False:
-            return False
-        if ret is True:
+        # For full steps the stepsize scaling is skipped, which saves an
+        # IntVar temporary per step in the common case.
+        if self._fstep != 1.:
+            dx = self._fstep*dx
+        # A reusable scratch buffer is offered to the scheme, so schemes that
+        # support the out keyword do not have to allocate the delta on every
+        # step. Schemes without support simply ignore it.
+        if self._scratch is None or self._scratch.shape != Y0.shape:
+            self._scratch = np.empty(
+                Y0.shape, dtype=np.result_type(Y0.dtype, np.float64))
+        ret = self.scheme(x0, Y0, dx, out=self._scratch, **self.controller)
+        # Booleans are passed through directly, everything else is a delta
+        # that goes into the buffer.
+        if ret is True or ret is False:
             return ret
-        else:
-            self.Y._buffer = ret
-            return True
+        Y0._buffer = ret
+        return True
@@ -14,6 +14,11 @@ class Scheme:
 
     __name__ = "Scheme"
 
+    # Slots avoid the per-instance dict and speed up the attribute lookups
+    # in the integration loop. Subclasses without __slots__ still get a
+    # regular dict for additional attributes.
+    __slots__ = ("_scheme", "_controller", "_description")
+
     def __init__(self, scheme, controller={}, description=""):
         """Abstract integration scheme.
         The integration scheme itself is callable.
@@ -1,7 +1,9 @@
 from simframe.integration.scheme import Scheme
 
+import numpy as np
 
-def _f_expl_1_euler(x0, Y0, dx, *args, dYdx=None, **kwargs):
+
+def _f_expl_1_euler(x0, Y0, dx, *args, dYdx=None, out=None, **kwargs):
     """Explicit 1st-order Euler integration scheme
 
     Parameters
@@ -14,6 +16,8 @@ def _f_expl_1_euler(x0, Y0, dx, *args, dYdx=None, **kwargs):
         Stepsize of integration variable
     dYdx : Field, optional, default : None
         Current derivative. Will be calculated, if not set.
+    out : ndarray, optional, default : None
+        Buffer the delta is written into. Will be allocated, if not set.
     args : additional positional arguments
     kwargs : additional keyworda arguments
 
@@ -29,7 +33,12 @@ def _f_expl_1_euler(x0, Y0, dx, *args, dYdx=None, **kwargs):
        | 1 
     """
     k0 = Y0.derivative(x0, Y0) if dYdx is None else dYdx
-    return dx*k0
+    # Multiplying into a plain ndarray avoids creating an intermediate
+    # Field/IntVar view with its attribute initialization per step.
+    if out is None:
+        out = np.empty(np.shape(Y0), dtype=np.result_type(k0, dx))
+    np.multiply(k0, dx, out=out)
+    return out
 
 
 class expl_1_euler(Scheme):
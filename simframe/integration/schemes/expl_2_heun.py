@@ -36,9 +36,13 @@ def _f_expl_2_heun(x0, Y0, dx, *args, dYdx=None, **kwargs):
          | 1/2 1/2
     """
     k0 = Y0.derivative(x0, Y0) if dYdx is None else dYdx
-    k1 = Y0.derivative(x0 + c1*dx, Y0 + a10*k0*dx)
+    k1 = Y0.derivative(x0 + c1*dx, Y0 + (a10*dx)*k0)
 
-    return dx*(b0*k0 + b1*k1)
+    # The combination is accumulated in-place to avoid intermediate temporaries
+    dY = b0*k0
+    dY += b1*k1
+    dY *= dx
+    return dY
 
 
 class expl_2_heun(Scheme):
@@ -1,11 +1,13 @@
 from simframe.integration.scheme import Scheme
 
+import numpy as np
+
 # Butcher coefficients
 a10 = 0.5
 c1 = 0.5
 
 
-def _f_expl_2_midpoint(x0, Y0, dx, *args, dYdx=None, **kwargs):
+def _f_expl_2_midpoint(x0, Y0, dx, *args, dYdx=None, out=None, **kwargs):
     """Explicit 2nd-order midpoint method
 
     Parameters
@@ -18,6 +20,8 @@ def _f_expl_2_midpoint(x0, Y0, dx, *args, dYdx=None, **kwargs):
         Stepsize of integration variable
     dYdx : Field, optional, default : None
         Current derivative. Will be calculated, if not set.
+    out : ndarray, optional, default : None
+        Buffer the delta is written into. Will be allocated, if not set.
     args : additional positional arguments
     kwargs : additional keyworda arguments
 
@@ -34,9 +38,16 @@ def _f_expl_2_midpoint(x0, Y0, dx, *args, dYdx=None, **kwargs):
          |  0   1
     """
     k0 = Y0.derivative(x0, Y0) if dYdx is None else dYdx
-    k1 = Y0.derivative(x0 + c1*dx, Y0 + a10*k0*dx)
-
-    return dx*k1
+    # Scaling with the scalar prefactor first saves a temporary array
+    # compared to a10*k0*dx.
+    k1 = Y0.derivative(x0 + c1*dx, Y0 + (a10*dx)*k0)
+
+    # Multiplying into a plain ndarray avoids creating an intermediate
+    # Field/IntVar view with its attribute initialization per step.
+    if out is None:
+        out = np.empty(np.shape(Y0), dtype=np.result_type(k1, dx))
+    np.multiply(k1, dx, out=out)
+    return out
 
 
 class expl_2_midpoint(Scheme):
@@ -36,10 +36,14 @@ def _f_expl_3_heun(x0, Y0, dx, *args, dYdx=None, **kwargs):
          | 1/4  0  3/4
     """
     k0 = Y0.derivative(x0, Y0) if dYdx is None else dYdx
-    k1 = Y0.derivative(x0 + c1*dx, Y0 + a10*k0*dx)
-    k2 = Y0.derivative(x0 + c2*dx, Y0 + a21*k1*dx)
-
-    return dx*(b0*k0 + b2*k2)
+    k1 = Y0.derivative(x0 + c1*dx, Y0 + (a10*dx)*k0)
+    k2 = Y0.derivative(x0 + c2*dx, Y0 + (a21*dx)*k1)
+
+    # The combination is accumulated in-place to avoid intermediate temporaries
+    dY = b0*k0
+    dY += b2*k2
+    dY *= dx
+    return dY
 
 
 class expl_3_heun(Scheme):
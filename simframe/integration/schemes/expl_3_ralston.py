@@ -37,10 +37,15 @@ def _f_expl_3_ralston(x0, Y0, dx, *args, dYdx=None, **kwargs):
          | 2/9 1/3 4/9
     """
     k0 = Y0.derivative(x0, Y0) if dYdx is None else dYdx
-    k1 = Y0.derivative(x0 + c1*dx, Y0 + a10*k0*dx)
-    k2 = Y0.derivative(x0 + c2*dx, Y0 + a21*k1*dx)
-
-    return dx*(b0*k0 + b1*k1 + b2*k2)
+    k1 = Y0.derivative(x0 + c1*dx, Y0 + (a10*dx)*k0)
+    k2 = Y0.derivative(x0 + c2*dx, Y0 + (a21*dx)*k1)
+
+    # The combination is accumulated in-place to avoid intermediate temporaries
+    dY = b0*k0
+    dY += b1*k1
+    dY += b2*k2
+    dY *= dx
+    return dY
 
 
 class expl_3_ralston(Scheme):
@@ -36,10 +36,21 @@ def _f_expl_3_ssprk(x0, Y0, dx, *args, dYdx=None, **kwargs):
          | 1/6 1/6 2/3
     """
     k0 = Y0.derivative(x0, Y0) if dYdx is None else dYdx
-    k1 = Y0.derivative(x0 + dx, Y0 + k0 * dx)
-    k2 = Y0.derivative(x0 + c2*dx, Y0 + (a20*k0 + a21*k1)*dx)
-
-    return dx*(b0*k0 + b1*k1 + b2*k2)
+    k1 = Y0.derivative(x0 + dx, Y0 + dx*k0)
+
+    # The stage vector and the combination are accumulated in-place to
+    # avoid intermediate temporaries
+    Y2 = a20*k0
+    Y2 += a21*k1
+    Y2 *= dx
+    Y2 += Y0
+    k2 = Y0.derivative(x0 + c2*dx, Y2)
+
+    dY = b0*k0
+    dY += b1*k1
+    dY += b2*k2
+    dY *= dx
+    return dY
 
 
 class expl_3_ssprk(Scheme):
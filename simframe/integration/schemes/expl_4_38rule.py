@@ -1,5 +1,7 @@
 from simframe.integration.scheme import Scheme
 
+import numpy as np
+
 # Butcher coefficients
 a10 = 1/3
 a20 = -1/3
@@ -7,7 +9,7 @@ b0, b1, b2, b3 = 1/8, 3/8, 3/8, 1/8
 c1, c2 = 1/3, 2/3
 
 
-def _f_expl_4_38rule(x0, Y0, dx, *args, dYdx=None, **kwargs):
+def _f_expl_4_38rule(x0, Y0, dx, *args, dYdx=None, out=None, **kwargs):
     """Explicit 4th-order 3/8 rule method
 
     Parameters
@@ -20,6 +22,8 @@ def _f_expl_4_38rule(x0, Y0, dx, *args, dYdx=None, **kwargs):
         Stepsize of integration variable
     dYdx : Field, optional, default : None
         Current derivative. Will be calculated, if not set.
+    out : ndarray, optional, default : None
+        Buffer the delta is written into. Will be allocated, if not set.
     args : additional positional arguments
     kwargs : additional keyworda arguments
 
@@ -39,11 +43,31 @@ def _f_expl_4_38rule(x0, Y0, dx, *args, dYdx=None, **kwargs):
     """
 
     k0 = Y0.derivative(x0, Y0) if dYdx is None else dYdx
-    k1 = Y0.derivative(x0 + c1*dx, Y0 + a10*k0 * dx)
-    k2 = Y0.derivative(x0 + c2*dx, Y0 + (a20*k0 + k1)*dx)
-    k3 = Y0.derivative(x0 + dx, Y0 + (k0 - k1 + k2)*dx)
+    k1 = Y0.derivative(x0 + c1*dx, Y0 + (a10*dx)*k0)
+
+    # The stage vectors and the final combination are accumulated in-place
+    # to avoid allocating a temporary array for every intermediate sum.
+    Y2 = a20*k0
+    Y2 += k1
+    Y2 *= dx
+    Y2 += Y0
+    k2 = Y0.derivative(x0 + c2*dx, Y2)
+
+    Y3 = k0 - k1
+    Y3 += k2
+    Y3 *= dx
+    Y3 += Y0
+    k3 = Y0.derivative(x0 + dx, Y3)
 
-    return dx*(b0*k0 + b1*k1 + b2*k2 + b3*k3)
+    if out is None:
+        dY = b0*k0
+    else:
+        dY = np.multiply(k0, b0, out=out)
+    dY += b1*k1
+    dY += b2*k2
+    dY += b3*k3
+    dY *= dx
+    return dY
 
 
 class expl_4_38rule(Scheme):
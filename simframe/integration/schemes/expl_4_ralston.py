@@ -40,11 +40,29 @@ def _f_expl_4_ralston(x0, Y0, dx, *args, dYdx=None, **kwargs):
     """
 
     k0 = Y0.derivative(x0, Y0) if dYdx is None else dYdx
-    k1 = Y0.derivative(x0 + c1*dx, Y0 + a10*k0 * dx)
-    k2 = Y0.derivative(x0 + c2*dx, Y0 + (a20*k0 + a21*k1)*dx)
-    k3 = Y0.derivative(x0 + dx, Y0 + (a30*k0 + a31*k1 + a32*k2)*dx)
+    k1 = Y0.derivative(x0 + c1*dx, Y0 + (a10*dx)*k0)
 
-    return dx*(b0*k0 + b1*k1 + b2*k2 + b3*k3)
+    # The stage vectors and the combination are accumulated in-place to
+    # avoid intermediate temporaries
+    Y2 = a20*k0
+    Y2 += a21*k1
+    Y2 *= dx
+    Y2 += Y0
+    k2 = Y0.derivative(x0 + c2*dx, Y2)
+
+    Y3 = a30*k0
+    Y3 += a31*k1
+    Y3 += a32*k2
+    Y3 *= dx
+    Y3 += Y0
+    k3 = Y0.derivative(x0 + dx, Y3)
+
+    dY = b0*k0
+    dY += b1*k1
+    dY += b2*k2
+    dY += b3*k3
+    dY *= dx
+    return dY
 
 
 class expl_4_ralston(Scheme):
@@ -39,11 +39,17 @@ def _f_expl_4_runge_kutta(x0, Y0, dx, *args, dYdx=None, **kwargs):
     """
 
     k0 = Y0.derivative(x0, Y0) if dYdx is None else dYdx
-    k1 = Y0.derivative(x0 + c1*dx, Y0 + a10*k0*dx)
-    k2 = Y0.derivative(x0 + c2*dx, Y0 + a21*k1*dx)
-    k3 = Y0.derivative(x0 + dx, Y0 + k2*dx)
-
-    return dx*(b0*k0 + b1*k1 + b2*k2 + b3*k3)
+    k1 = Y0.derivative(x0 + c1*dx, Y0 + (a10*dx)*k0)
+    k2 = Y0.derivative(x0 + c2*dx, Y0 + (a21*dx)*k1)
+    k3 = Y0.derivative(x0 + dx, Y0 + dx*k2)
+
+    # The combination is accumulated in-place to avoid intermediate temporaries
+    dY = b0*k0
+    dY += b1*k1
+    dY += b2*k2
+    dY += b3*k3
+    dY *= dx
+    return dY
 
 
 class expl_4_runge_kutta(Scheme):
@@ -1,6 +1,11 @@
 from simframe.integration.scheme import Scheme
 
 import numpy as np
+from scipy import sparse
+
+# Cache of identity matrices keyed by problem size. The identity is only
+# read when the system matrix is assembled, so it can be reused across steps.
+_EYE_CACHE = {}
 
 
 def _f_impl_1_euler_direct(x0, Y0, dx, jac=None, *args, **kwargs):
@@ -32,10 +37,19 @@ def _f_impl_1_euler_direct(x0, Y0, dx, jac=None, *args, **kwargs):
     """
     jac = Y0.jacobian(x0 + dx) if jac is None else jac  # Jacobain
     N = jac.shape[0] if jac.ndim else 1                 # Problem size
-    eye = np.eye(N)                                     # Identity matrix
 
-    A = eye - dx * jac
-    return np.dot(np.linalg.inv(A)-eye, Y0)
+    b = Y0[None] if Y0.shape == () else Y0
+    # Solving the linear system directly is one LU factorization and one
+    # triangular solve instead of explicitly forming the inverse matrix.
+    if sparse.issparse(jac):
+        A = sparse.identity(N, format="csc") - dx*jac
+        return sparse.linalg.spsolve(A, b) - Y0
+    eye = _EYE_CACHE.get(N)
+    if eye is None:
+        eye = np.eye(N)
+        _EYE_CACHE[N] = eye
+    A = eye - dx*jac
+    return np.linalg.solve(A, b) - Y0
 
 
 class impl_1_euler_direct(Scheme):
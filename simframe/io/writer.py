@@ -1,3 +1,6 @@
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+import copy
 from pathlib import Path
 
 from simframe.io.reader import Reader
@@ -12,7 +15,7 @@ class Writer(object):
     __name__ = "Writer"
 
     def __init__(self, func, datadir="data", filename="data", zfill=4, extension="out", overwrite=False, dumping=True,
-                 reader=None, verbosity=1, description="", options={}):
+                 reader=None, verbosity=1, description="", options={}, threaded=False):
         """Parameters
         ----------
         func : callable
@@ -34,7 +37,11 @@ class Writer(object):
         verbosity : int, optional, default : 1
             Verbosity of writer
         options : dict, optional, default : {}
-            Optional keyword arguments that need to be passed to writing algorithm"""
+            Optional keyword arguments that need to be passed to writing algorithm
+        threaded : boolean, optional, default : False
+            If True outputs are written in a background thread"""
+        self._executor = None
+        self._futures = deque([])
         self._func = func
         self.datadir = datadir
         self.filename = filename
@@ -44,9 +51,18 @@ class Writer(object):
         self.dumping = dumping
         self.description = description
         self.options = options
+        self.threaded = threaded
         self.verbosity = verbosity
         self.read = reader(self) if reader is not None else None
 
+    def __getstate__(self):
+        # The executor and its futures cannot be pickled or copied and are
+        # recreated on demand.
+        state = self.__dict__.copy()
+        state["_executor"] = None
+        state["_futures"] = deque([])
+        return state
+
     @property
     def datadir(self):
         '''Data directory of output files.'''
@@ -55,6 +71,7 @@ class Writer(object):
     @datadir.setter
     def datadir(self, value):
         self._datadir = Path(value)
+        self._fn_cache = None
 
     @property
     def description(self):
@@ -79,6 +96,7 @@ class Writer(object):
         if value.startswith("."):
             raise ValueError("extension should not start with '.'")
         self._extension = value
+        self._fn_cache = None
 
     @property
     def filename(self):
@@ -92,6 +110,7 @@ class Writer(object):
         if value == "":
             raise ValueError("filename cannot be empty.")
         self._filename = value
+        self._fn_cache = None
 
     @property
     def options(self):
@@ -144,6 +163,20 @@ class Writer(object):
         else:
             self._dumping = False
 
+    @property
+    def threaded(self):
+        '''If ``True`` outputs are written in a background thread.'''
+        return self._threaded
+
+    @threaded.setter
+    def threaded(self, value):
+        if not isinstance(value, int):
+            raise TypeError("<threaded> has to be of type bool.")
+        if value:
+            self._threaded = True
+        else:
+            self._threaded = False
+
     @property
     def verbosity(self):
         '''Verbosity of the writer.'''
@@ -221,16 +254,18 @@ class Writer(object):
         filename : str
             The constructed filename"""
 
-        # Removing . from extension if given
-        ext = self.extension
-        if ext != "":
-            if not ext.startswith("."):
-                ext = "." + ext
-
-        number = str(i).zfill(self.zfill)
-        filename = self.filename + number + ext
+        # The path prefix and extension only change with the writer
+        # attributes, so they are cached between calls.
+        if self._fn_cache is None:
+            # Removing . from extension if given
+            ext = self.extension
+            if ext != "":
+                if not ext.startswith("."):
+                    ext = "." + ext
+            self._fn_cache = (str(self.datadir.joinpath(self.filename)), ext)
 
-        return self.datadir.joinpath(filename)
+        prefix, ext = self._fn_cache
+        return Path(prefix + str(i).zfill(self.zfill) + ext)
 
     def writedump(self, frame, filename=None):
         """Writes the ``Frame`` to dump file
@@ -280,6 +315,39 @@ class Writer(object):
         if self.verbosity > 0:
             msg = f"Writing file {colorize(filename, 'blue')}"
             print(msg)
+        if self.threaded:
+            # Errors of finished previous writes would otherwise be swallowed.
+            # Unfinished futures stay in the queue until write() or wait()
+            # sees them completed.
+            while self._futures and self._futures[0].done():
+                self._futures.popleft().result()
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=1)
+            # The frame is copied so the integration can continue while the
+            # snapshot is written in the background.
+            snapshot = copy.deepcopy(owner)
+            self._futures.append(self._executor.submit(
+                self._writesnapshot, snapshot, filename))
+        else:
+            self._writesnapshot(owner, filename)
+
+    def _writesnapshot(self, owner, filename):
+        """Performs the actual write of an output including the dump file.
+
+        Parameters
+        ----------
+        owner : Frame
+            ``Frame`` object or copy thereof to be written
+        filename : Path
+            path to file to be written"""
         self._func(owner, filename, **self.options)
         if self.dumping:
             self.writedump(owner)
+
+    def wait(self):
+        """Blocks until all pending background writes are finished.
+
+        Only meaningful if the writer is ``threaded``; a no-op otherwise.
+        Exceptions raised by the background writes are re-raised here."""
+        while self._futures:
+            self._futures.popleft().result()
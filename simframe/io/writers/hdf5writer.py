@@ -17,7 +17,10 @@ class hdf5writer(Writer):
         filename = kwargs.pop("filename", "data")
         extension = kwargs.pop("extension", "hdf5")
         description = kwargs.pop("description", "HDF5 file format using h5py")
-        options = kwargs.pop("options", {"com": "lzf", "comopts": None})
+        # No compression by default. The single-threaded compression filters
+        # are CPU-bound and dominate the write time for snapshot-heavy runs.
+        # Pass options={"com": "lzf"} to get the old behavior.
+        options = kwargs.pop("options", {"com": None, "comopts": None})
         super().__init__(
             _hdf5wrapper,
             filename=filename,
@@ -29,7 +32,7 @@ class hdf5writer(Writer):
         )
 
 
-def _hdf5wrapper(obj, filename, com="lzf", comopts=None):
+def _hdf5wrapper(obj, filename, com=None, comopts=None):
     """Wrapper to write object to HDF5 file.
 
     This function recursively calls a another functions thats goes through the object tree.
@@ -49,11 +52,15 @@ def _hdf5wrapper(obj, filename, com="lzf", comopts=None):
         compression options, see `h5py.File`'s `create_dataset` for details
     """
 
-    with h5py.File(filename, "w") as hdf5file:
+    # The core driver stages the file in memory and spills it to disk once on
+    # close, so the many small dataset writes do not each hit the file system.
+    # libver="latest" selects the faster current file format structures.
+    with h5py.File(filename, "w", libver="latest",
+                   driver="core", backing_store=True) as hdf5file:
         _writehdf5(obj, hdf5file, com=com, comopts=comopts)
 
 
-def _writehdf5(obj, file, com="lzf", comopts=None, prefix=""):
+def _writehdf5(obj, file, com=None, comopts=None, prefix=""):
     """Writes a given object to a h5py file.
 
     By default all attributes of the object are written out, excluding the ones that start with an underscore.
@@ -99,16 +106,19 @@ def _writehdf5(obj, file, com="lzf", comopts=None, prefix=""):
 
         # Check for number
         if isinstance(val, (numbers.Number, np.number)):
-            file.create_dataset(
-                name,
-                data=val
-            )
+            # Scalars are stored as HDF5 attributes. Attributes bypass the
+            # dataset B-tree, so this is one cheap metadata operation per
+            # scalar instead of a full dataset creation.
+            grp = file.require_group(prefix[:-1]) if prefix else file
+            grp.attrs[key] = val
         # Check for tuple/list
         elif type(val) in [tuple, list]:
             if None in val:
                 raise ValueError("HDF5 cannot store None values.")
             # special case for list of strings
-            if any([type(_v) == str for _v in val]):
+            # A generator short-circuits on the first string instead of
+            # materializing a full list of booleans.
+            if any(type(_v) is str for _v in val):
                 file.create_dataset(
                     name,
                     data=np.array(val, dtype=object),
@@ -215,7 +225,12 @@ class hdf5reader(Reader):
         ret = []
         for f in files:
             with h5py.File(f, "r") as hdf5file:
-                A = np.array(hdf5file[loc][()])
+                if loc in hdf5file:
+                    A = np.array(hdf5file[loc][()])
+                else:
+                    # Scalars are stored as attributes of their group
+                    grp, _, leaf = loc.rpartition("/")
+                    A = np.array(hdf5file[grp or "/"].attrs[leaf])
                 ret.append(A)
         return np.array(ret)
 
@@ -237,4 +252,7 @@ class hdf5reader(Reader):
                 ret[ds] = self._readgroup(gr[ds])
             else:
                 ret[ds] = gr[ds][()]
+        # Scalars are stored as attributes of their group
+        for key, val in gr.attrs.items():
+            ret[key] = val
         return SimpleNamespace(**ret)
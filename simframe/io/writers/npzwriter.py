@@ -0,0 +1,211 @@
+import numbers
+import numpy as np
+import os
+
+from simframe.io.reader import Reader
+from simframe.io.writer import Writer
+from simframe.frame.field import Field
+from simframe.utils.simplenamespace import SimpleNamespace
+
+
+class npzwriter(Writer):
+    """Class for writing NumPy ``.npz`` output files.
+
+    The object tree is flattened into a dictionary of arrays and written with
+    a single ``numpy.savez`` call. This avoids the per-dataset metadata
+    overhead of HDF5 and is therefore faster for snapshots that are dominated
+    by a few large arrays."""
+
+    def __init__(self, *args, **kwargs):
+        filename = kwargs.pop("filename", "data")
+        extension = kwargs.pop("extension", "npz")
+        description = kwargs.pop(
+            "description", "NumPy file format using numpy.savez")
+        super().__init__(
+            _npzwrapper,
+            filename=filename,
+            extension=extension,
+            description=description,
+            reader=npzreader,
+            *args, **kwargs
+        )
+
+
+def _npzwrapper(obj, filename):
+    """Wrapper to write object to ``.npz`` file.
+
+    The object tree is flattened into a single dictionary, so the file is
+    written with one ``numpy.savez`` call.
+
+    Parameters
+    ----------
+    obj : object
+        the object to be stored in a file
+    filename : string
+        path to file"""
+
+    flat = {}
+    _flattennpz(obj, flat)
+    np.savez(filename, **flat)
+
+
+def _flattennpz(obj, flat, prefix=""):
+    """Flattens a given object into a dictionary of arrays.
+
+    By default all attributes of the object are collected, excluding the ones
+    that start with an underscore. Fields with attribute Field.save == False
+    will be skipped. Nested objects are stored with ``/``-separated names.
+
+    Parameters
+    ----------
+    obj : object
+        the object to be stored in a file
+    flat : dict
+        dictionary the arrays are collected into
+
+    Keywords
+    --------
+    prefix : str
+        a prefix prepended to the name of each attribute"""
+
+    if hasattr(obj, "_description") and obj._description is not None and prefix == "":
+        flat["description"] = np.asarray(obj._description)
+
+    for key, val in obj.__dict__.items():
+
+        # Ignore hidden variables
+        if key.startswith('_'):
+            continue
+        # Skip fields that should not be stored
+        if isinstance(val, Field) and val.save == False:
+            continue
+
+        name = prefix + key
+
+        # Check for number or string
+        if isinstance(val, (numbers.Number, np.number, str)):
+            flat[name] = np.asarray(val)
+        # Check for tuple/list
+        elif type(val) in [tuple, list]:
+            if None in val:
+                raise ValueError("npz cannot store None values.")
+            flat[name] = np.asarray(val)
+        # Check for Numpy array
+        elif isinstance(val, np.ndarray):
+            flat[name] = np.asarray(val)
+        # Dicts not implemented, yet
+        elif type(val) == dict:
+            raise NotImplementedError(
+                "Storing dict not yet implemented in npzwriter.")
+        # Check for None
+        elif val is None:
+            raise ValueError("npz cannot store None values.")
+        # Other objects
+        else:
+            _flattennpz(val, flat, prefix=name + "/")
+
+
+class npzreader(Reader):
+    """Reader class for the npz writer."""
+
+    def __init__(self, writer):
+        """npz reader
+
+        Parameters
+        ----------
+        writer : Writer
+            Writer object to which the reader belongs."""
+        super().__init__(writer)
+
+    def output(self, output):
+        """Reads a single output file.
+
+        Parameters
+        ----------
+        output : str or int
+            Path to filename to be read or number of output
+
+        Returns
+        -------
+        data : SimpleNamespace
+            Namespace of data in file."""
+
+        if not isinstance(output, str):
+            output = self._writer._getfilename(output)
+
+        if not os.path.isfile(output):
+            raise RuntimeError("File does not exist.")
+
+        ret = {}
+        with np.load(output, allow_pickle=False) as npzfile:
+            for name in npzfile.files:
+                val = npzfile[name]
+                if val.shape == ():
+                    val = val[()]
+                _insert(ret, name.split("/"), val)
+        return _tonamespace(ret)
+
+    def sequence(self, field):
+        """Reading the entire sequence of a specific field.
+
+        Parameters
+        ----------
+        field : string
+            String with location of requested field
+
+        Returns
+        -------
+        seq : array
+            Array with requested values
+
+        Notes
+        -----
+        ``field`` is addressing the values just as in the parent frame object.
+        E.g. ``"groupA.groupB.fieldC"`` is addressing ``Frame.groupA.groupB.fieldC``."""
+        files = self.listfiles()
+        if files == []:
+            raise RuntimeError("<datadir> does not exist or is empty.")
+        if not isinstance(field, str):
+            raise TypeError("<field> has to be of type string.")
+        loc = field.replace(".", "/")
+        ret = []
+        for f in files:
+            with np.load(f, allow_pickle=False) as npzfile:
+                A = np.array(npzfile[loc])
+                ret.append(A)
+        return np.array(ret)
+
+
+def _insert(d, loc, val):
+    """Inserts a value into a nested dictionary.
+
+    Parameters
+    ----------
+    d : dict
+        dictionary the value is inserted into
+    loc : list
+        List of strings with the location within d
+    val : object
+        Value to be inserted"""
+    if len(loc) > 1:
+        _insert(d.setdefault(loc[0], {}), loc[1:], val)
+    else:
+        d[loc[0]] = val
+
+
+def _tonamespace(d):
+    """Converts a nested dictionary into a nested ``SimpleNamespace``.
+
+    Parameters
+    ----------
+    d : dict
+        nested dictionary
+
+    Returns
+    -------
+    ns : SimpleNamespace
+        Namespace of the dictionary"""
+    ret = {}
+    for key, val in d.items():
+        ret[key] = _tonamespace(val) if isinstance(val, dict) else val
+    return SimpleNamespace(**ret)
@@ -3,6 +3,7 @@
 
 import numpy as np
 import pytest
+from scipy import sparse
 from simframe import Frame
 from simframe import Instruction
 from simframe import Integrator
@@ -435,6 +436,29 @@ def test_impl_1_euler_direct():
     assert np.allclose(f.Y, 7.25657159014803e-05)
 
 
+def test_impl_1_euler_direct_sparse():
+    f = Frame()
+    f.addfield("Y", np.ones(2))
+
+    def jac(f, x):
+        return sparse.diags([-1., -1.])
+    f.Y.jacobinator = jac
+    f.addintegrationvariable("x", 0.)
+
+    def dx(f):
+        return 0.1
+    f.x.updater = dx
+    f.x.snapshots = [10.]
+
+    f.integrator = Integrator(f.x)
+    f.integrator.instructions = [
+        Instruction(schemes.impl_1_euler_direct, f.Y)
+    ]
+
+    f.run()
+    assert np.allclose(f.Y, 7.25657159014803e-05)
+
+
 def test_impl_1_euler_gmres():
     f = Frame()
     f.addfield("Y", 1.)
@@ -0,0 +1,89 @@
+# Tests for the npzwriter writer
+
+
+import numpy as np
+import pytest
+from simframe import Frame
+from simframe import writers
+
+
+def test_npzwriter_skip():
+    f = Frame()
+    f.writer = writers.npzwriter()
+    f.addfield("x", 0., save=False)
+    f.writeoutput(0)
+    with pytest.raises(KeyError):
+        f.writer.read.sequence("x")
+    files = f.writer.datadir.glob("*")
+    for file in files:
+        file.unlink()
+    f.writer.datadir.rmdir()
+
+
+def test_npzwriter_none():
+    f = Frame()
+    f.n = None
+    f.writer = writers.npzwriter()
+    with pytest.raises(ValueError):
+        f.writeoutput(0)
+    f.n = [1, None]
+    with pytest.raises(ValueError):
+        f.writeoutput(1)
+    files = f.writer.datadir.glob("*")
+    for file in files:
+        file.unlink()
+    f.writer.datadir.rmdir()
+
+
+def test_npzwriter_dict():
+    f = Frame()
+    f.n = {1: 1}
+    f.writer = writers.npzwriter()
+    with pytest.raises(NotImplementedError):
+        f.writeoutput(0)
+    files = f.writer.datadir.glob("*")
+    for file in files:
+        file.unlink()
+    f.writer.datadir.rmdir()
+
+
+def test_npzwriter_number():
+    f = Frame()
+    f.n = 1
+    f.writer = writers.npzwriter()
+    f.writeoutput(0)
+    f.writeoutput(1)
+    data0000 = f.writer.read.output(0)
+    assert data0000.n == 1
+    n = f.writer.read.sequence("n")
+    assert np.all(n == [1, 1])
+    data = f.writer.read.all()
+    assert np.all(data.n == [1, 1])
+    files = f.writer.datadir.glob("*")
+    for file in files:
+        file.unlink()
+    f.writer.datadir.rmdir()
+
+
+def test_npzwriter_fields():
+    f = Frame()
+    f.addfield("Y", np.ones(5))
+    f.addgroup("A")
+    f.A.addfield("k", 2.)
+    f.writer = writers.npzwriter()
+    f.writeoutput(0)
+    f.writeoutput(1)
+    data0000 = f.writer.read.output(0)
+    assert np.all(data0000.Y == np.ones(5))
+    assert data0000.A.k == 2.
+    Y = f.writer.read.sequence("Y")
+    assert np.all(Y == np.ones((2, 5)))
+    k = f.writer.read.sequence("A.k")
+    assert np.all(k == [2., 2.])
+    data = f.writer.read.all()
+    assert np.all(data.Y == np.ones((2, 5)))
+    assert np.all(data.A.k == [2., 2.])
+    files = f.writer.datadir.glob("*")
+    for file in files:
+        file.unlink()
+    f.writer.datadir.rmdir()
@@ -85,3 +85,20 @@ def test_write():
     for file in files:
         file.unlink()
     f.writer.datadir.rmdir()
+
+
+def test_writer_threaded():
+    f = Frame()
+    f.addfield("Y", 1.)
+    f.writer = writers.hdf5writer(threaded=True)
+    with pytest.raises(TypeError):
+        f.writer.threaded = "data"
+    assert f.writer.threaded
+    f.writeoutput(0)
+    f.writer.wait()
+    data0000 = f.writer.read.output(0)
+    assert data0000.Y == 1.
+    files = f.writer.datadir.glob("*")
+    for file in files:
+        file.unlink()
+    f.writer.datadir.rmdir()